@@ -1,10 +1,25 @@
 import os
-import glob
-import argparse
+import sys
+import hashlib
+import functools
+import multiprocessing
+import fastexcel
 import xlsxwriter
+import numpy as np
 import polars as pl
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Tuple, List, Dict, Optional
+from typing import Tuple, List, Dict, Optional, Union
+
+try:
+    import jetxl  # Optional Rust-based Arrow writer, much faster than xlsxwriter on large diffs
+except ImportError:
+    jetxl = None
+
+try:
+    from numba import njit  # Optional JIT for the row-equality reduction on numeric sheets
+except ImportError:
+    njit = None
 
 # --- Configuration & Data Structures ---
 
@@ -19,6 +34,26 @@ class CompareResult:
 class Config:
     MAX_EXCEL_ROWS = 1000000  # Leaving a safe margin for headers (limit is 1,048,576)
     MISMATCH_THRESHOLD = 0.10   # 10%
+    SIZE_RATIO_BAND = (0.5, 2.0)  # With --size-check, V2/V1 file size ratio outside which a single-sheet pair is skipped
+
+@functools.lru_cache(maxsize=256)
+def _dtype_str(dtype: pl.DataType) -> str:
+    """Interned str(dtype); wide sheets stringify the same few dtypes over and over."""
+    return str(dtype)
+
+if njit is not None:
+    # Serial and without fastmath: sheet threads call it concurrently, and fastmath would assume away the NaNs
+    @njit(cache=True, nogil=True)
+    def _row_any_ne(a, b, out):
+        """Fused row-wise 'any cell differs' over two F-ordered 2D buffers; NaN on both sides counts as equal."""
+        out[:] = False
+        for j in range(a.shape[1]):
+            for i in range(a.shape[0]):
+                x, y = a[i, j], b[i, j]
+                if x != y and not (x != x and y != y):
+                    out[i] = True
+else:
+    _row_any_ne = None
 
 # --- Core Logic Classes ---
 
@@ -28,16 +63,22 @@ class ReportGenerator:
     @staticmethod
     def write_report_txt(output_dir: str, file_name: str, results: Dict[str, CompareResult]):
         report_path = os.path.join(output_dir, "report.txt")
+
+        # Build the whole report in memory and write it in one go
+        lines = [f"--- Comparison Report for: {file_name} ---\n\n"]
+        for sheet, result in results.items():
+            lines.extend([
+                f"Sheet: {sheet}\n",
+                f"Shape V1: {result.shape1} | Shape V2: {result.shape2}\n",
+                f"Status: {result.status}\n",
+                f"Match Rate: {result.match_rate * 100:.2f}%\n",
+            ])
+            if result.details:
+                lines.append(f"Details: {result.details}\n")
+            lines.append("-" * 40 + "\n")
+
         with open(report_path, "w", encoding="utf-8") as f:
-            f.write(f"--- Comparison Report for: {file_name} ---\n\n")
-            for sheet, result in results.items():
-                f.write(f"Sheet: {sheet}\n")
-                f.write(f"Shape V1: {result.shape1} | Shape V2: {result.shape2}\n")
-                f.write(f"Status: {result.status}\n")
-                f.write(f"Match Rate: {result.match_rate * 100:.2f}%\n")
-                if result.details:
-                    f.write(f"Details: {result.details}\n")
-                f.write("-" * 40 + "\n")
+            f.write("".join(lines))
 
     @staticmethod
     def write_differences_xlsx(output_dir: str, diff_df: pl.DataFrame):
@@ -47,20 +88,36 @@ class ReportGenerator:
         diff_path = os.path.join(output_dir, "differences.xlsx")
         
         # Handle Excel Row Limits by chunking into multiple sheets if necessary
-        with xlsxwriter.Workbook(diff_path) as workbook:
-            total_rows = diff_df.height
-            for i in range(0, total_rows, Config.MAX_EXCEL_ROWS):
-                chunk = diff_df.slice(i, Config.MAX_EXCEL_ROWS)
-                sheet_name = f"Diff_{i // Config.MAX_EXCEL_ROWS + 1}"
-                chunk.write_excel(workbook=workbook, worksheet=sheet_name)
+        chunks = []
+        total_rows = diff_df.height
+        for i in range(0, total_rows, Config.MAX_EXCEL_ROWS):
+            chunk = diff_df.slice(i, Config.MAX_EXCEL_ROWS)
+            sheet_name = f"Diff_{i // Config.MAX_EXCEL_ROWS + 1}"
+            chunks.append((sheet_name, chunk))
+
+        if jetxl is not None:
+            # Zero-copy Arrow hand-off; jetxl builds the sheets' XML in parallel
+            sheets = [{"data": chunk.to_arrow(), "name": sheet_name} for sheet_name, chunk in chunks]
+            jetxl.write_sheets_arrow(sheets, diff_path, min(len(sheets), os.cpu_count() or 1))
+            return
+
+        # constant_memory streams rows to disk in order (so not via write_excel), keeping memory flat on large diffs
+        with xlsxwriter.Workbook(diff_path, {"constant_memory": True, "use_zip64": True}) as workbook:
+            for sheet_name, chunk in chunks:
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, chunk.columns)
+                for row_num, row in enumerate(chunk.iter_rows(), start=1):
+                    for col_num, value in enumerate(row):
+                        # write_string keeps values like "=1+1" or URLs from turning into formulas or links
+                        if isinstance(value, str):
+                            worksheet.write_string(row_num, col_num, value)
+                        else:
+                            worksheet.write(row_num, col_num, value)
 
 
 class SheetComparator:
     """Handles the hierarchical early-stopping logic for two specific sheets."""
     
-    def __init__(self, use_hash: bool):
-        self.use_hash = use_hash
-
     def compare(self, df1: pl.DataFrame, df2: pl.DataFrame) -> Tuple[CompareResult, Optional[pl.DataFrame]]:
         shape1, shape2 = df1.shape, df2.shape
         
@@ -75,7 +132,7 @@ class SheetComparator:
             
         # 3. Data Types Match
         if df1.dtypes != df2.dtypes:
-            type_diff = {c: (str(t1), str(t2)) for c, t1, t2 in zip(df1.columns, df1.dtypes, df2.dtypes) if t1 != t2}
+            type_diff = {c: (_dtype_str(t1), _dtype_str(t2)) for c, t1, t2 in zip(df1.columns, df1.dtypes, df2.dtypes) if t1 != t2}
             return CompareResult("Column type mismatch", 0.0, f"Type diffs: {type_diff}", shape1, shape2), None
 
         # 4. Empty Files Check
@@ -86,26 +143,14 @@ class SheetComparator:
         return self._compare_data(df1, df2, shape1, shape2)
 
     def _compare_data(self, df1: pl.DataFrame, df2: pl.DataFrame, shape1: tuple, shape2: tuple) -> Tuple[CompareResult, Optional[pl.DataFrame]]:
-        if self.use_hash:
+        if self._is_numeric_matrix(df1, df2):
+            # Homogeneous null-free numeric sheet: one JIT-compiled pass over a 2D buffer per frame
+            mismatch_mask = self._numeric_mismatch_mask(df1, df2)
+        else:
+            # Row hashes flag differing rows in a single pass. A hash collision makes two different rows look
+            # equal, so that row goes undetected; at roughly 2^-64 per row this risk is accepted
             h1, h2 = df1.hash_rows(), df2.hash_rows()
             mismatch_mask = h1 != h2
-        else:
-            # Build an expression to check for any mismatch across all columns, handling Nulls safely
-            df2_renamed = df2.rename({c: f"{c}_v2" for c in df2.columns})
-            combined = pl.concat([df1, df2_renamed], how="horizontal")
-            
-            exprs = []
-            for c in df1.columns:
-                c1, c2 = pl.col(c), pl.col(f"{c}_v2")
-                # True if one is null and other is not, OR if their values differ
-                is_diff = (
-                    (c1.is_null() & c2.is_not_null()) |
-                    (c1.is_not_null() & c2.is_null()) |
-                    ((c1 != c2).fill_null(False))
-                )
-                exprs.append(is_diff)
-                
-            mismatch_mask = combined.select(pl.any_horizontal(exprs)).to_series()
 
         mismatch_count = mismatch_mask.sum()
         total_rows = df1.height
@@ -121,70 +166,125 @@ class SheetComparator:
         diff_df = self._generate_differences_df(df1, df2, mismatch_mask)
         return CompareResult("Data mismatch", match_rate, f"{mismatch_count} rows differ.", shape1, shape2), diff_df
 
-    def _generate_differences_df(self, df1: pl.DataFrame, df2: pl.DataFrame, mismatch_mask: pl.Series) -> pl.DataFrame:
-        df1_idx = df1.with_row_index("Row Index").filter(mismatch_mask)
-        df2_idx = df2.with_row_index("Row Index").filter(mismatch_mask)
+    @staticmethod
+    def _is_numeric_matrix(df1: pl.DataFrame, df2: pl.DataFrame) -> bool:
+        # Only worth it with the JIT kernel; without Numba, hash_rows is faster than any NumPy pass
+        if _row_any_ne is None:
+            return False
+        dtypes = set(df1.dtypes)
+        if len(dtypes) != 1:
+            return False
+        # No Decimal (to_numpy() gives objects) and no nulls (they become NaN, which hashing tells apart)
+        dtype = dtypes.pop()
+        return (dtype.is_float() or dtype.is_integer()) and not any(s.null_count() for s in (*df1.get_columns(), *df2.get_columns()))
 
-        # Cast to string for reliable unpivoting
-        df1_str = df1_idx.select(["Row Index"] + [pl.col(c).cast(pl.Utf8) for c in df1.columns])
-        df2_str = df2_idx.select(["Row Index"] + [pl.col(c).cast(pl.Utf8) for c in df2.columns])
+    @staticmethod
+    def _numeric_mismatch_mask(df1: pl.DataFrame, df2: pl.DataFrame) -> pl.Series:
+        # to_numpy() hands back column-major buffers; asfortranarray only copies if it didn't
+        a, b = np.asfortranarray(df1.to_numpy()), np.asfortranarray(df2.to_numpy())
+        out = np.empty(a.shape[0], dtype=np.bool_)
+        _row_any_ne(a, b, out)
+        return pl.Series(out)
 
-        # Unpivot (Note: replace 'unpivot' with 'melt' if using Polars < 0.20)
-        melt1 = df1_str.unpivot(index="Row Index", variable_name="Column Name", value_name="Value V1")
-        melt2 = df2_str.unpivot(index="Row Index", variable_name="Column Name", value_name="Value V2")
+    def _generate_differences_df(self, df1: pl.DataFrame, df2: pl.DataFrame, mismatch_mask: pl.Series) -> pl.DataFrame:
+        # Gather only the mismatched rows, indexed under a name no sheet column uses (e.g. its own "Row Index")
+        index_name = "Row Index"
+        while index_name in df1.columns:
+            index_name = f"_{index_name}"
+        row_index = mismatch_mask.arg_true().alias(index_name)
+        df1_idx = df1[row_index].with_columns(row_index)
+        df2_idx = df2[row_index].with_columns(row_index)
+
+        # Only columns that differ within the mismatched rows are worth stringifying
+        diff_cols = [c for c in df1.columns if df1_idx.get_column(c).ne_missing(df2_idx.get_column(c)).any()]
+        if not diff_cols:
+            return pl.DataFrame(schema={"Row Index": pl.UInt32, "Column Name": pl.Utf8, "Column type": pl.Utf8, "Value V1": pl.Utf8, "Value V2": pl.Utf8})
+
+        # Pair each cell's two values in a {Value V1, Value V2} struct (cast to string for reliable unpivoting),
+        # so a single unpivot yields both sides and no join is needed
+        pairs = df1_idx.lazy().select(
+            index_name,
+            *[pl.struct(pl.col(c).cast(pl.Utf8).alias("Value V1"), pl.lit(df2_idx.get_column(c)).cast(pl.Utf8).alias("Value V2")).alias(c)
+              for c in diff_cols],
+        )
 
-        diff_df = melt1.join(melt2, on=["Row Index", "Column Name"])
+        # Column types are attached with a per-column lookup (no join needed)
+        type_map = dict(zip(df1.columns, (_dtype_str(t) for t in df1.dtypes)))
 
-        # Keep only cells that actually differ
-        diff_df = diff_df.filter(
-            (pl.col("Value V1") != pl.col("Value V2")).fill_null(True) & 
-            ~(pl.col("Value V1").is_null() & pl.col("Value V2").is_null())
+        # Unpivot (Note: replace 'unpivot' with 'melt' if using Polars < 0.20)
+        diff_lf = (
+            pairs.unpivot(index=index_name, variable_name="Column Name", value_name="Values")
+            .unnest("Values")
+            # Keep only cells that actually differ
+            .filter(pl.col("Value V1").ne_missing(pl.col("Value V2")))
+            .with_columns(pl.col("Column Name").replace_strict(type_map, return_dtype=pl.Utf8).alias("Column type"))
+            .rename({index_name: "Row Index"})
+            .select(["Row Index", "Column Name", "Column type", "Value V1", "Value V2"])
+            .sort(["Row Index", "Column Name"])
         )
 
-        # Attach Column Type
-        schema_df = pl.DataFrame({"Column Name": list(df1.columns), "Column type": [str(t) for t in df1.dtypes]})
-        diff_df = diff_df.join(schema_df, on="Column Name")
-        
-        return diff_df.select(["Row Index", "Column Name", "Column type", "Value V1", "Value V2"]).sort(["Row Index", "Column Name"])
+        # The streaming engine pipelines unpivot -> filter -> sort in batches instead of materializing each step
+        return diff_lf.collect(engine="streaming")
 
 
 class FileComparator:
     """Manages the extraction and sheet-level comparison of two Excel files."""
     
-    def __init__(self, use_hash: bool):
-        self.sheet_comparator = SheetComparator(use_hash)
-
-    def process_pair(self, file1_path: str, file2_path: str, output_dir: str):
+    def __init__(self, sheet_workers: Optional[int] = None, size_check: bool = False):
+        self.sheet_comparator = SheetComparator()
+        self.sheet_workers = sheet_workers or os.cpu_count() or 1
+        self.size_check = size_check
+
+    def process_pair(self, file1_path: str, file2_path: str, output_dir: str) -> List[str]:
+        """Compares a file pair, writes its reports and returns the tracker rows to print."""
+        rows = []
         file_name1 = os.path.basename(file1_path)
         file_name2 = os.path.basename(file2_path)
 
         # 0. File Name Match
         if file_name1 != file_name2:
-            self._print_row(file_name1, "N/A", "N/A", "File name mismatch", f"V1: {file_name1} != V2: {file_name2}")
-            return
+            rows.append(_format_row(file_name1, "N/A", "N/A", "File name mismatch", f"V1: {file_name1} != V2: {file_name2}"))
+            return rows
 
-        # Read Sheets using Calamine
+        # Only the sheet names are read here; sheets are decoded when they are compared
         try:
-            sheets1 = pl.read_excel(file1_path, engine="calamine", sheet_id=None)
-            sheets2 = pl.read_excel(file2_path, engine="calamine", sheet_id=None)
+            sheet_names1 = fastexcel.read_excel(file1_path).sheet_names
+            sheet_names2 = fastexcel.read_excel(file2_path).sheet_names
         except Exception as e:
-            self._print_row(file_name1, "ERROR", "ERROR", "Read Error", str(e))
-            return
-
-        # 1. Sheet Names Match
-        if set(sheets1.keys()) != set(sheets2.keys()):
-            diff = set(sheets1.keys()) ^ set(sheets2.keys())
-            self._print_row(file_name1, "N/A", "N/A", "Sheet names mismatch", f"Mismatched sheets: {diff}")
-            return
+            rows.append(_format_row(file_name1, "ERROR", "ERROR", "Read Error", str(e)))
+            return rows
+
+        # 1. Sheet Names Match (same writer usually means same order, so sets are only built on a mismatch;
+        # sheets in a different order still match and are compared in V1's order)
+        if sheet_names1 != sheet_names2:
+            names1, names2 = set(sheet_names1), set(sheet_names2)
+            if names1 != names2:
+                diff = names1 ^ names2
+                rows.append(_format_row(file_name1, "N/A", "N/A", "Sheet names mismatch", f"Mismatched sheets: {diff}"))
+                return rows
+
+        # 2. File Metadata Check (no sheet data is decoded)
+        identical = _files_identical(file1_path, file2_path)
+        if not identical and self.size_check:
+            size_details = self._size_mismatch(file1_path, file2_path, len(sheet_names1))
+            if size_details is not None:
+                rows.append(_format_row(file_name1, "N/A", "N/A", "Likely shape mismatch", size_details))
+                return rows
 
         results = {}
         all_diffs = []
 
-        for sheet_name in sheets1.keys():
-            result, diff_df = self.sheet_comparator.compare(sheets1[sheet_name], sheets2[sheet_name])
+        # Sheets are independent and Polars releases the GIL in its kernels, so compare them in threads
+        with ThreadPoolExecutor(max_workers=max(1, min(len(sheet_names1), self.sheet_workers))) as executor:
+            futures = {sheet_name: executor.submit(self._compare_sheet, file1_path, file2_path, sheet_name, identical)
+                       for sheet_name in sheet_names1}
+
+        # Dicts keep insertion order, so the report follows the workbook's sheet order
+        for sheet_name, future in futures.items():
+            result, diff_df = future.result()
             results[sheet_name] = result
             
-            self._print_row(f"{file_name1} [{sheet_name}]", str(result.shape1), str(result.shape2), result.status, result.details)
+            rows.append(_format_row(f"{file_name1} [{sheet_name}]", str(result.shape1), str(result.shape2), result.status, result.details))
 
             if diff_df is not None:
                 diff_df = diff_df.with_columns(pl.lit(sheet_name).alias("Sheet Name"))
@@ -197,56 +297,151 @@ class FileComparator:
             final_diff = final_diff.select(["Sheet Name", "Row Index", "Column Name", "Column type", "Value V1", "Value V2"])
             ReportGenerator.write_differences_xlsx(output_dir, final_diff)
 
-    def _print_row(self, name: str, shape1: str, shape2: str, status: str, details: str):
-        print(f"{name:<30} | {shape1:<15} | {shape2:<15} | {status:<25} | {details}")
+        return rows
+
+    @staticmethod
+    def _size_mismatch(file1_path: str, file2_path: str, sheet_count: int) -> Optional[str]:
+        """Opt-in heuristic: returns details if a single-sheet pair's file sizes are too far apart to compare."""
+        # File size doesn't determine shape, so this is only a guess, and only made for single-sheet workbooks
+        if sheet_count != 1:
+            return None
+        size1, size2 = os.path.getsize(file1_path), os.path.getsize(file2_path)
+        low, high = Config.SIZE_RATIO_BAND
+        if size1 == 0 or not low <= size2 / size1 <= high:
+            return f"Size diff: {size1} vs {size2} bytes (skipped by --size-check)"
+        return None
+
+    def _compare_sheet(self, file1_path: str, file2_path: str, sheet_name: str,
+                       identical: bool) -> Tuple[CompareResult, Optional[pl.DataFrame]]:
+        # read_excel (not a bare fastexcel load) so empty rows/columns are dropped and integers inferred
+        try:
+            df1 = pl.read_excel(file1_path, engine="calamine", sheet_name=sheet_name)
+            df2 = None if identical else pl.read_excel(file2_path, engine="calamine", sheet_name=sheet_name)
+        except Exception as e:
+            return CompareResult("Read Error", 0.0, str(e)), None
+
+        # Byte-identical files only need V1 decoded, for the shapes in the report
+        if identical:
+            return CompareResult("Perfect match", 1.0, "Files are byte-identical", df1.shape, df1.shape), None
+
+        return self.sheet_comparator.compare(df1, df2)
+
+
+def _format_row(name: str, shape1: str, shape2: str, status: str, details: str) -> str:
+    return f"{name:<30} | {shape1:<15} | {shape2:<15} | {status:<25} | {details}"
+
+
+def _files_identical(path1: str, path2: str) -> bool:
+    return os.path.getsize(path1) == os.path.getsize(path2) and _file_digest(path1) == _file_digest(path2)
+
+
+def _file_digest(path: str) -> bytes:
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _first_xlsx(directory: str) -> Optional[str]:
+    # Same matches as glob("*.xlsx"), which also skips hidden files, without compiling a pattern
+    with os.scandir(directory) as it:
+        return next((e.path for e in it if e.is_file() and e.name.endswith(".xlsx") and not e.name.startswith(".")), None)
+
+
+def _process_pair_worker(args: Tuple[str, str, str], sheet_workers: int, size_check: bool) -> List[str]:
+    """Top-level (picklable) entry point used by the process pool in App.run."""
+    file1_path, file2_path, output_dir = args
+    return FileComparator(sheet_workers, size_check).process_pair(file1_path, file2_path, output_dir)
 
 
 class App:
     """CLI orchestrator that parses folders and runs the comparisons."""
     
-    def __init__(self, folder_path: str, use_hash: bool):
+    def __init__(self, folder_path: str, size_check: bool = False):
         self.folder_path = folder_path
-        self.file_comparator = FileComparator(use_hash)
+        self.size_check = size_check
 
     def run(self):
         print("\n" + "="*120)
         print(f"{'Target':<30} | {'Shape V1':<15} | {'Shape V2':<15} | {'Status':<25} | {'Details'}")
         print("="*120)
 
-        for item in os.listdir(self.folder_path):
-            file_dir = os.path.join(self.folder_path, item)
-            if not os.path.isdir(file_dir):
-                continue
+        # Discovery is done up front; each entry is either a folder-level error row or a file pair to compare
+        entries: List[Union[str, Tuple[str, str, str]]] = []
+
+        # scandir's DirEntry caches the file type, so is_dir() needs no extra stat call per entry
+        with os.scandir(self.folder_path) as it:
+            dir_entries = [e for e in it if e.is_dir()]
+
+        for dir_entry in dir_entries:
+            item, file_dir = dir_entry.name, dir_entry.path
 
             # Dynamically detect the two subdirectories
-            subdirs = [os.path.join(file_dir, d) for d in os.listdir(file_dir) if os.path.isdir(os.path.join(file_dir, d))]
+            with os.scandir(file_dir) as it:
+                subdirs = [e.path for e in it if e.is_dir()]
             if len(subdirs) != 2:
-                print(f"{item:<30} | {'N/A':<15} | {'N/A':<15} | {'Folder Error':<25} | Expected 2 subfolders, found {len(subdirs)}")
+                entries.append(_format_row(item, "N/A", "N/A", "Folder Error", f"Expected 2 subfolders, found {len(subdirs)}"))
                 continue
 
             subdirs.sort()  # Ensures consistent V1/V2 ordering based on folder names
             
             # Find the xlsx files inside the subdirectories
-            file1_list = glob.glob(os.path.join(subdirs[0], "*.xlsx"))
-            file2_list = glob.glob(os.path.join(subdirs[1], "*.xlsx"))
+            file1 = _first_xlsx(subdirs[0])
+            file2 = _first_xlsx(subdirs[1])
 
-            if not file1_list or not file2_list:
-                print(f"{item:<30} | {'N/A':<15} | {'N/A':<15} | {'Missing File':<25} | Missing .xlsx in one or both subfolders.")
+            if file1 is None or file2 is None:
+                entries.append(_format_row(item, "N/A", "N/A", "Missing File", "Missing .xlsx in one or both subfolders."))
                 continue
 
-            # Process the pair
-            self.file_comparator.process_pair(file1_list[0], file2_list[0], file_dir)
+            entries.append((file1, file2, file_dir))
+
+        # Split the cores between the pair processes and their sheet threads
+        cpu_count = os.cpu_count() or 1
+        pair_count = sum(isinstance(entry, tuple) for entry in entries)
+        sheet_workers = max(1, cpu_count // max(1, pair_count))
+
+        # Pairs run in spawned (fork-safe) processes, printed in discovery order; a single pair runs in-process
+        executor = None
+        if pair_count > 1:
+            # Spawned workers inherit the environment before importing Polars, which caps each one's thread pool
+            os.environ.setdefault("POLARS_MAX_THREADS", str(sheet_workers))
+            executor = ProcessPoolExecutor(max_workers=min(cpu_count, pair_count), mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futures = {}
+            if executor is not None:
+                futures = {i: executor.submit(_process_pair_worker, entry, sheet_workers, self.size_check)
+                           for i, entry in enumerate(entries) if isinstance(entry, tuple)}
+            for i, entry in enumerate(entries):
+                if i in futures:
+                    rows = futures[i].result()
+                elif isinstance(entry, tuple):
+                    rows = _process_pair_worker(entry, sheet_workers, self.size_check)
+                else:
+                    rows = [entry]
+                for row in rows:
+                    print(row)
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         print("="*120 + "\nComparison Complete.\n")
 
 # --- Execution ---
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Optimized XLSX Comparator using Polars and Calamine.")
-    parser.add_argument("folder_path", type=str, help="Path to the main folder containing the file directories.")
-    parser.add_argument("--hash", action="store_true", help="Use native Polars row hashing for faster comparison.")
-    
-    args = parser.parse_argument()
-    
-    app = App(args.folder_path, args.hash)
-    app.run()
\ No newline at end of file
+    # Fast path for the common `main.py <folder>` call: skips importing and building argparse entirely
+    if len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        app = App(sys.argv[1])
+    else:
+        import argparse
+
+        parser = argparse.ArgumentParser(description="Optimized XLSX Comparator using Polars and Calamine.")
+        parser.add_argument("folder_path", type=str, help="Path to the main folder containing the file directories.")
+        parser.add_argument("--size-check", action="store_true",
+                            help="Skip single-sheet pairs whose file sizes differ by more than 2x, reporting a likely shape mismatch.")
+
+        args = parser.parse_args()
+
+        app = App(args.folder_path, args.size_check)
+    app.run()